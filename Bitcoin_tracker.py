@@ -1,35 +1,226 @@
-import requests
+import atexit
+import threading
 import json
-from datetime import datetime
+import os
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import NamedTuple
 import time
 import sys
 
+# orjson is optional; its decode errors subclass json.JSONDecodeError
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# requests is imported on first use (see _import_requests) to keep startup fast
+requests = None
+
+# Concurrent Binance requests; the connection pool keeps one socket per worker
+MAX_CONCURRENT_REQUESTS = 4
+
+# miniTicker fields a streamed frame must carry to be used:
+# close plus the rolling 24h open/high/low read by _show_basic_24h_price
+TICKER_FIELDS = ('c', 'o', 'h', 'l')
+
+# Closed candles never change, so they are kept on disk between runs
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "bitcoin_tracker")
+
+# Candle length in milliseconds for each interval used
+INTERVAL_MS = {
+    '15m': 15 * 60 * 1000,
+    '1h': 60 * 60 * 1000,
+    '4h': 4 * 60 * 60 * 1000,
+    '1d': 24 * 60 * 60 * 1000
+}
+
+class Klines(NamedTuple):
+    """Candle opening times (ms) and closing prices as parallel lists"""
+    timestamps: list
+    prices: list
+
 # Bitcoin color definition
 BTC = "\033[38;5;208m"
 reset = "\033[0m"
 
+# ASCII chart bars indexed by height (0-20)
+CHART_BARS = ["█" * (height + 1) for height in range(21)]
+
+# Pre-encoded color escapes wrapped around every chart row
+CHART_PREFIX = (BTC + " ").encode()
+CHART_SUFFIX = (" " + reset + "\n").encode()
+
+def _utc_offset_ms(timestamp):
+    """Local UTC offset in milliseconds at a millisecond timestamp"""
+    return time.localtime(timestamp / 1000).tm_gmtoff * 1000
+
+def _write_bytes(data):
+    """Writes already encoded output straight to stdout's binary buffer"""
+    sys.stdout.flush()  # keep ordering with text written before
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode(sys.stdout.encoding or "utf-8"))
+        return
+    buffer.write(data)
+    buffer.flush()
+
+def _import_requests():
+    """Imports requests into the module namespace the first time it is needed"""
+    global requests
+    import requests
+    import requests.adapters
+    return requests
+
 class BitcoinConverterBinance:
     def __init__(self):
         self.base_url = "https://api.binance.com/api/v3"
         self.symbol = "BTCUSDT"  # BTC/USDT pair on Binance
+        self.stream_url = f"wss://stream.binance.com:9443/ws/{self.symbol.lower()}@miniTicker"
+        
+        # Reuse one keep-alive session so repeated calls skip the TLS handshake
+        from urllib3.util.retry import Retry
+        _import_requests()
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            # Transient 429/5xx answers are retried here, before any fallback.
+            # Connect/read failures are not, so an offline call fails fast.
+            max_retries=Retry(total=3, connect=0, read=0, backoff_factor=0.25,
+                              status_forcelist=(429, 500, 502, 503, 504),
+                              allowed_methods=frozenset(["GET"]))
+        )
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            'User-Agent': 'Bitcoin-tracker',
+            'Accept-Encoding': 'gzip'
+        })
+        
+        # Short-lived in-memory cache: key -> (timestamp, value)
+        self._cache = {}
+        
+        # Worker threads for composite views that need several endpoints
+        self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
         
+        # Latest miniTicker pushed by the websocket: (timestamp, payload).
+        # Binance keeps its rolling 24h open/high/low/close up to date.
+        self._latest_ticker = None
+        self._stream_thread = None
+    
+    def close(self):
+        """Releases pooled connections and worker threads"""
+        self._executor.shutdown(wait=False)
+        self.session.close()
+    
+    def _gather(self, *calls):
+        """Runs (function, *args) calls concurrently, returns results in order"""
+        futures = [self._executor.submit(*call) for call in calls]
+        return [future.result() for future in futures]
+    
+    def _cache_get(self, key, ttl):
+        """Returns the cached value for key if younger than ttl seconds"""
+        hit = self._cache.get(key)
+        if hit and time.time() - hit[0] < ttl:
+            return hit[1]
+        return None
+    
+    def _cache_set(self, key, value):
+        """Stores value in the cache (failed lookups are not cached)"""
+        if value is not None:
+            self._cache[key] = (time.time(), value)
+        return value
+    
+    def invalidate_price(self):
+        """Forces the next get_current_price call to hit Binance"""
+        self._cache.pop("price", None)
+        
+    def start_price_stream(self):
+        """Starts a background websocket subscriber for live price updates"""
+        if self._stream_thread is not None:
+            return False
+        
+        # websockets is optional; without it prices are polled over REST
+        try:
+            import asyncio
+            import websockets
+        except ImportError:
+            return False
+        
+        self._stream_thread = threading.Thread(
+            target=lambda: asyncio.run(self._stream_loop()),
+            daemon=True
+        )
+        self._stream_thread.start()
+        return True
+    
+    async def _stream_loop(self):
+        """Keeps the miniTicker subscription alive, reconnecting with backoff"""
+        import asyncio
+        import websockets
+        
+        delay = 1
+        while True:
+            try:
+                async with websockets.connect(self.stream_url) as ws:
+                    delay = 1
+                    async for message in ws:
+                        self._store_ticker(message)
+            except Exception:
+                # Any failure (closed socket, open timeout, bad frame handling)
+                # must back off and reconnect rather than end the thread
+                pass
+            
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60)
+    
+    def _store_ticker(self, message):
+        """Keeps a streamed frame only if it is a usable miniTicker payload"""
+        try:
+            payload = json_loads(message)
+            ticker = {field: float(payload[field]) for field in TICKER_FIELDS}
+        except (ValueError, KeyError, TypeError):
+            return
+        self._latest_ticker = (time.time(), ticker)
+    
+    def _streamed_ticker(self, max_age=3):
+        """Returns the last websocket miniTicker if younger than max_age seconds"""
+        streamed = self._latest_ticker
+        if streamed and time.time() - streamed[0] < max_age:
+            return streamed[1]
+        return None
+    
     def get_current_price(self):
         """Gets the current Bitcoin price in USD using Binance"""
+        # Prefer a fresh price pushed by the websocket stream
+        streamed = self._streamed_ticker()
+        if streamed:
+            return float(streamed['c'])
+        
+        cached = self._cache_get("price", 5)
+        if cached is not None:
+            return cached
+        
         try:
             url = f"{self.base_url}/ticker/price"
             params = {'symbol': self.symbol}
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
             if 'price' in data:
-                return float(data['price'])
+                return self._cache_set("price", float(data['price']))
             return None
+        except (requests.exceptions.HTTPError, requests.exceptions.RetryError) as e:
+            print(f"Binance error: {e}")
+            # Endpoint still failing after the adapter's retries, try the alternative
+            return self._cache_set("price", self._get_alternative_price())
         except requests.exceptions.RequestException as e:
+            # Same host, so the alternative endpoint would fail the same way
             print(f"Connection error to Binance: {e}")
-            # Try alternative endpoint
-            return self._get_alternative_price()
+            return None
         except (KeyError, ValueError, json.JSONDecodeError) as e:
             print(f"Error processing data: {e}")
             return None
@@ -43,7 +234,7 @@ class BitcoinConverterBinance:
             url = f"{self.base_url}/ticker/24hr"
             params = {'symbol': self.symbol}
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -53,11 +244,39 @@ class BitcoinConverterBinance:
                 # Average between bid and ask
                 return (float(data['bidPrice']) + float(data['askPrice'])) / 2
             return None
-        except:
+        except (requests.exceptions.RequestException, ValueError):
             return None
     
+    def _candle_cache_path(self, interval):
+        """Path of the on-disk cache of closed candles for an interval"""
+        return os.path.join(CACHE_DIR, f"{self.symbol}_{interval}.json")
+    
+    def _load_closed_candles(self, interval):
+        """Loads cached closed candles for an interval as Klines"""
+        try:
+            with open(self._candle_cache_path(interval)) as f:
+                data = json.load(f)
+            return Klines(data['timestamps'], data['prices'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return Klines([], [])
+    
+    def _save_closed_candles(self, interval, candles):
+        """Stores closed candles on disk, keeping at most 1000 of them"""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(self._candle_cache_path(interval), 'w') as f:
+                json.dump({'timestamps': candles.timestamps[-1000:],
+                           'prices': candles.prices[-1000:]}, f)
+        except OSError:
+            pass
+    
     def get_historical_data(self, days):
-        """Gets historical data from Binance"""
+        """Gets historical data from Binance as Klines"""
+        # Interval and limit are derived from days, so it is the whole key
+        cached = self._cache_get(("klines", days), 60)
+        if cached is not None:
+            return cached
+        
         try:
             # Convert days to milliseconds
             end_time = int(time.time() * 1000)
@@ -77,29 +296,47 @@ class BitcoinConverterBinance:
                 interval = '1d'   # 1 day for longer periods
                 limit = min(days, 1000)  # Binance has limit of 1000 records
             
+            # Reuse closed candles from disk when they cover the window start
+            bar_ms = INTERVAL_MS[interval]
+            stored = self._load_closed_candles(interval)
+            first = bisect_left(stored.timestamps, start_time)
+            cached = Klines(stored.timestamps[first:], stored.prices[first:])
+            if not cached.timestamps or cached.timestamps[0] >= start_time + bar_ms:
+                stored = cached = Klines([], [])
+            
+            # Only the candles after the cached ones are requested
             url = f"{self.base_url}/klines"
             params = {
                 'symbol': self.symbol,
                 'interval': interval,
-                'startTime': start_time,
+                'startTime': cached.timestamps[-1] + bar_ms if cached.timestamps else start_time,
                 'endTime': end_time,
                 'limit': limit
             }
             
-            response = requests.get(url, params=params, timeout=15)
+            response = self.session.get(url, params=params, timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             
-            # Format data for compatibility
-            historical = []
-            for candle in data:
-                if len(candle) >= 6:  # Each candle has [time, open, high, low, close, ...]
-                    timestamp = candle[0]  # Opening time
-                    # Use closing price (index 4)
-                    price = float(candle[4])
-                    historical.append([timestamp, price])
+            # Each candle has [time, open, high, low, close, ..., close time, ...]
+            # Use opening time and closing price (index 4)
+            timestamps = [candle[0] for candle in data]
+            prices = [float(candle[4]) for candle in data]
             
-            return historical if historical else None
+            # The last candle may still be forming on Binance's clock, so it is
+            # never persisted; it is requested again on the next call
+            closed = len(data) - 1
+            if closed:
+                self._save_closed_candles(interval, Klines(
+                    stored.timestamps + timestamps[:closed],
+                    stored.prices + prices[:closed]
+                ))
+            
+            if not cached.timestamps and not timestamps:
+                return None
+            historical = Klines((cached.timestamps + timestamps)[-limit:],
+                                (cached.prices + prices)[-limit:])
+            return self._cache_set(("klines", days), historical)
         except requests.exceptions.RequestException as e:
             print(f"Historical data connection error to Binance: {e}")
             return None
@@ -112,16 +349,20 @@ class BitcoinConverterBinance:
     
     def get_detailed_price_info(self):
         """Gets detailed 24-hour information"""
+        cached = self._cache_get("ticker24h", 30)
+        if cached is not None:
+            return cached
+        
         try:
             url = f"{self.base_url}/ticker/24hr"
             params = {'symbol': self.symbol}
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             
-            return data
-        except:
+            return self._cache_set("ticker24h", data)
+        except (requests.exceptions.RequestException, ValueError):
             return None
     
     def show_textual_24h_price(self):
@@ -130,8 +371,11 @@ class BitcoinConverterBinance:
         print(f"{BTC} BITCOIN PRICE🪙 - LAST 24 HOURS {reset}")
         print("="*60)
         
-        # Get detailed 24-hour data
-        detailed_data = self.get_detailed_price_info()
+        # Get detailed 24-hour data and chart data concurrently
+        detailed_data, data = self._gather(
+            (self.get_detailed_price_info,),
+            (self.get_historical_data, 1)
+        )
         
         if detailed_data:
             try:
@@ -156,10 +400,9 @@ class BitcoinConverterBinance:
                 else:
                     print("➡ Trend: STABLE")
                 
-                # Get historical data for chart
-                data = self.get_historical_data(1)
+                # Historical data for chart
                 if data:
-                    prices = [item[1] for item in data]
+                    prices = data.prices
                     
                     # Show simple ASCII chart
                     print("\n📊 SIMPLE CHART (ASCII):")
@@ -173,11 +416,22 @@ class BitcoinConverterBinance:
                         if price_range > 0:
                             # Show only some points for readability
                             step = max(1, len(prices) // 12)
-                            for i in range(0, len(prices), step):
-                                height = int(((prices[i] - price_min_chart) / price_range) * 20)
-                                timestamp = datetime.fromtimestamp(data[i][0]/1000).strftime('%H:%M')
-                                bar = "█" * (height + 1)
-                                print(f"{BTC} {timestamp}: {bar} ${prices[i]:,.2f} {reset}")
+                            sampled_times = data.timestamps[::step]
+                            sampled_prices = prices[::step]
+                            
+                            # Scale once, then only the sampled points are mapped to 0-20
+                            scale = 20 / price_range
+                            encoding = sys.stdout.encoding or "utf-8"
+                            rows = [
+                                CHART_PREFIX
+                                + (f"{datetime.fromtimestamp(timestamp/1000).strftime('%H:%M')}: "
+                                   f"{CHART_BARS[int((price - price_min_chart) * scale)]} "
+                                   f"${price:,.2f}").encode(encoding)
+                                + CHART_SUFFIX
+                                for timestamp, price in zip(sampled_times, sampled_prices)
+                            ]
+                            # Emit the whole chart with a single write
+                            _write_bytes(b"".join(rows))
                     else:
                         print("Insufficient data to display chart")
                 
@@ -193,20 +447,28 @@ class BitcoinConverterBinance:
     
     def _show_basic_24h_price(self):
         """Backup method to show basic 24h data"""
-        data = self.get_historical_data(1)
-        
-        if not data:
-            print("Could not get historical data.")
-            current_price = self.get_current_price()
-            if current_price:
-                print(f"\n {BTC} 💰 Current price: ${current_price:,.2f}{reset}")
-            return
-        
-        prices = [item[1] for item in data]
-        current_price = prices[-1] if prices else 0
-        price_min = min(prices) if prices else 0
-        price_max = max(prices) if prices else 0
-        initial_price = prices[0] if prices else 0
+        # The websocket ticker already carries the rolling 24h window
+        streamed = self._streamed_ticker()
+        if streamed:
+            current_price = float(streamed['c'])
+            price_min = float(streamed['l'])
+            price_max = float(streamed['h'])
+            initial_price = float(streamed['o'])
+        else:
+            data = self.get_historical_data(1)
+            
+            if not data:
+                print("Could not get historical data.")
+                current_price = self.get_current_price()
+                if current_price:
+                    print(f"\n {BTC} 💰 Current price: ${current_price:,.2f}{reset}")
+                return
+            
+            prices = data.prices
+            current_price = prices[-1] if prices else 0
+            price_min = min(prices) if prices else 0
+            price_max = max(prices) if prices else 0
+            initial_price = prices[0] if prices else 0
         
         variation = current_price - initial_price
         variation_percentage = (variation / initial_price) * 100 if initial_price else 0
@@ -232,8 +494,7 @@ class BitcoinConverterBinance:
             print("="*60)
             return
         
-        prices = [item[1] for item in data]
-        dates = [datetime.fromtimestamp(item[0]/1000) for item in data]
+        prices = data.prices
         
         current_price = prices[-1] if prices else 0
         price_min = min(prices) if prices else 0
@@ -253,23 +514,31 @@ class BitcoinConverterBinance:
         print("-" * 50)
         
         if len(prices) >= 5:
-            # Group by approximate day
-            prices_by_day = {}
-            for i, (date, price) in enumerate(zip(dates, prices)):
-                day_key = date.strftime('%d/%m')
-                if day_key not in prices_by_day:
-                    prices_by_day[day_key] = []
-                prices_by_day[day_key].append(price)
+            # Group by local day straight from the millisecond timestamps,
+            # keeping a running (sum, count) per day
+            day_ms = 24 * 60 * 60 * 1000
             
-            for day, day_prices in list(prices_by_day.items())[-5:]:  # Last 5 days
-                if day_prices:
-                    average_price = sum(day_prices) / len(day_prices)
-                    print(f"{day}: ${average_price:,.2f} (average)")
+            # One offset serves the whole window unless it spans a DST change
+            offsets = {_utc_offset_ms(data.timestamps[0]), _utc_offset_ms(data.timestamps[-1])}
+            fixed_offset_ms = offsets.pop() if len(offsets) == 1 else None
+            
+            totals_by_day = {}
+            for timestamp, price in zip(data.timestamps, prices):
+                offset_ms = fixed_offset_ms if fixed_offset_ms is not None else _utc_offset_ms(timestamp)
+                day = (timestamp + offset_ms) // day_ms
+                total, count = totals_by_day.get(day, (0.0, 0))
+                totals_by_day[day] = (total + price, count + 1)
+            
+            for day, (total, count) in list(totals_by_day.items())[-5:]:  # Last 5 days
+                # Only one datetime is built per day
+                day_label = datetime.fromtimestamp(day * day_ms / 1000, timezone.utc).strftime('%d/%m')
+                average_price = total / count
+                print(f"{day_label}: ${average_price:,.2f} (average)")
         else:
             # Show available points
             step = max(1, len(prices) // 5)
             for i in range(0, len(prices), step):
-                date = dates[i].strftime('%d/%m %H:%M')
+                date = datetime.fromtimestamp(data.timestamps[i]/1000).strftime('%d/%m %H:%M')
                 price = prices[i]
                 print(f"{date}: ${price:,.2f}")
         
@@ -325,36 +594,67 @@ class BitcoinConverterBinance:
         
         input("\nPress Enter to continue...")
 
+# Shared converter so every entry point reuses one connection pool and cache
+_converter = None
+
+def get_converter():
+    """Returns the process-wide BitcoinConverterBinance, creating it on first use"""
+    global _converter
+    if _converter is None:
+        _converter = BitcoinConverterBinance()
+        atexit.register(_close_converter)
+    return _converter
+
+def _close_converter():
+    """Closes the shared converter so get_converter never returns a closed one"""
+    global _converter
+    if _converter is not None:
+        _converter.close()
+        _converter = None
+
+# Static parts of the main menu, each written with a single call
+MENU_HEADER = "\n".join([
+    "="*60,
+    f" {BTC}     🪙BITCOIN TRACKER & CONVERTER🪙 {reset}",
+    "="*60,
+    "Data source: Binance.com",
+    "Pair: BTC/USDT",
+    "="*60,
+    ""
+])
+
+MENU_OPTIONS = "\n".join([
+    "",
+    "MAIN MENU:",
+    "1. 📊 Price and 24-hour analysis",
+    "2. 📈 5-day analysis",
+    "3. 🪙💱💸 Bitcoin to USD converter",
+    "4. 🔄 Update price",
+    "5. 🚪 Exit",
+    "",
+    "="*60,
+    ""
+])
+
 def show_simple_menu():
     """Simplified main menu"""
-    converter = BitcoinConverterBinance()
+    converter = get_converter()
+    converter.start_price_stream()
     
     while True:
-        # Clear screen
-        print("\033c", end="")
-        
-        print("="*60)
-        print(f" {BTC}     🪙BITCOIN TRACKER & CONVERTER🪙 {reset}")
-        print("="*60)
-        print("Data source: Binance.com")
-        print("Pair: BTC/USDT")
-        print("="*60)
+        # Clear screen and show the header while the price is fetched
+        sys.stdout.write("\033c" + MENU_HEADER)
+        sys.stdout.flush()
         
         price = converter.get_current_price()
         if price:
-            print(f"\n {BTC}💰 Current Bitcoin🪙 price: ${price:,.2f} 💸USD{reset}")
-            print(f"   📅 Last update: {datetime.now().strftime('%H:%M:%S')}")
+            status = (f"\n {BTC}💰 Current Bitcoin🪙 price: ${price:,.2f} 💸USD{reset}\n"
+                      f"   📅 Last update: {datetime.now().strftime('%H:%M:%S')}\n")
         else:
-            print("\n⚠ Could not get current price from Binance")
-            print("   Check your internet connection or try again later")
-        
-        print("\nMAIN MENU:")
-        print("1. 📊 Price and 24-hour analysis")
-        print("2. 📈 5-day analysis")
-        print("3. 🪙💱💸 Bitcoin to USD converter")
-        print("4. 🔄 Update price")
-        print("5. 🚪 Exit")
-        print("\n" + "="*60)
+            status = ("\n⚠ Could not get current price from Binance\n"
+                      "   Check your internet connection or try again later\n")
+        
+        sys.stdout.write(status + MENU_OPTIONS)
         
         option = input("\nSelect an option (1-5): ")
         
@@ -371,6 +671,7 @@ def show_simple_menu():
             
         elif option == "4":
             print("\nUpdating price from Binance🪙...")
+            converter.invalidate_price()
             new_price = converter.get_current_price()
             if new_price:
                 print(f"✅ New price: ${new_price:,.2f}")
@@ -390,13 +691,12 @@ def show_simple_menu():
             time.sleep(1)
 
 if __name__ == "__main__":
+    print("Starting 🪙Bitcoin Tracker with Binance API...")
     try:
-        import requests
-        print("Starting 🪙Bitcoin Tracker with Binance API...")
-        print("Connecting to Binance...")
-        time.sleep(1)
-        show_simple_menu()
+        _import_requests()
     except ImportError:
         print("Error: You need to install requests")
         print("Install with: pip install requests")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+    print("Connecting to Binance...")
+    show_simple_menu()
\ No newline at end of file